@@ -24,6 +24,7 @@ import datetime
 import time
 import codecs
 import abc
+import textwrap
 from .. import log, LOG_CHECK, strformat, dummy, configuration, i18n
 
 _ = lambda x: x
@@ -46,6 +47,13 @@ Fields = dict(
 )
 del _
 
+# buffer size for file output; larger than the io.DEFAULT_BUFFER_SIZE
+# of 8KB to reduce the number of write calls on large link checks
+OutputBufferSize = 256 * 1024
+
+# line separator appended by writeln()
+Linesep = unicode(os.linesep)
+
 ContentTypes = dict(
     image=0,
     text=0,
@@ -64,6 +72,13 @@ class LogStatistics (object):
     - URL lengths
     """
 
+    # statistics are updated for each checked URL; slots make the
+    # attribute access cheaper and catch misspelled attribute names
+    __slots__ = ("number", "errors", "errors_printed", "warnings",
+                 "warnings_printed", "internal_errors", "link_types",
+                 "max_url_length", "min_url_length", "avg_url_length",
+                 "avg_number", "downloaded_bytes", "num_urls")
+
     def __init__ (self):
         """Initialize log statistics."""
         self.reset()
@@ -91,6 +106,8 @@ class LogStatistics (object):
         self.avg_number = 0
         # overall downloaded bytes
         self.downloaded_bytes = None
+        # number of checked URLs
+        self.num_urls = None
 
     def log_url (self, url_data, do_print):
         """Log URL statistics."""
@@ -100,29 +117,33 @@ class LogStatistics (object):
             if do_print:
                 self.errors_printed += 1
         num_warnings = len(url_data.warnings)
-        self.warnings += num_warnings
-        if do_print:
-            self.warnings_printed += num_warnings
+        if num_warnings:
+            self.warnings += num_warnings
+            if do_print:
+                self.warnings_printed += num_warnings
+        url = url_data.url
+        link_types = self.link_types
         if url_data.content_type:
             key = url_data.content_type.split('/', 1)[0].lower()
-            if key not in self.link_types:
+            if key not in link_types:
                 key = "other"
-        elif url_data.url.startswith(u"mailto:"):
+        elif url.startswith(u"mailto:"):
             key = "mail"
         else:
             key = "other"
-        self.link_types[key] += 1
-        if url_data.url:
-            l = len(url_data.url)
-            self.max_url_length = max(l, self.max_url_length)
-            if self.min_url_length == 0:
+        link_types[key] += 1
+        if url:
+            l = len(url)
+            if l > self.max_url_length:
+                self.max_url_length = l
+            min_url_length = self.min_url_length
+            if min_url_length == 0 or l < min_url_length:
                 self.min_url_length = l
-            else:
-                self.min_url_length = min(l, self.min_url_length)
             # track average number separately since empty URLs do not count
-            self.avg_number += 1
+            avg_number = self.avg_number + 1
+            self.avg_number = avg_number
             # calculate running average
-            self.avg_url_length += (l - self.avg_url_length) / self.avg_number
+            self.avg_url_length += (l - self.avg_url_length) / avg_number
 
     def log_internal_error (self):
         """Increase internal error count."""
@@ -171,23 +192,32 @@ class _Logger (object):
         """
         if 'parts' in args and "all" not in args['parts']:
             # only log given parts
-            self.logparts = args['parts']
+            self.logparts = frozenset(args['parts'])
+            # has_part() is called for each part of each logged URL,
+            # so bind it directly to the set lookup
+            self.has_part = self.logparts.__contains__
         else:
             # log all parts
             self.logparts = None
+        # localized log part names
+        self.field_labels = {key: _(value) for key, value in Fields.items()}
         # number of spaces before log parts for alignment
         self.logspaces = {}
         # maximum indent of spaces for alignment
         self.max_indent = 0
+        # text wrapper used by wrap()
+        self._wrapper = None
         # log statistics
         self.stats = LogStatistics()
         # encoding of output
         encoding = args.get("encoding", i18n.default_encoding)
         try:
-            encoding = codecs.lookup(encoding).name
+            codec_info = codecs.lookup(encoding)
         except LookupError:
-            encoding = i18n.default_encoding
-        self.output_encoding = encoding
+            codec_info = codecs.lookup(i18n.default_encoding)
+        self.output_encoding = codec_info.name
+        # cache the encoder function to avoid codec lookups on each call
+        self._encode = codec_info.encode
         # how to handle codec errors
         self.codec_errors = "replace"
         # Flag to see if logger is active. Can be deactivated on errors.
@@ -208,7 +238,7 @@ class _Logger (object):
     def encode (self, s):
         """Encode string with output encoding."""
         assert isinstance(s, unicode)
-        return s.encode(self.output_encoding, self.codec_errors)
+        return self._encode(s, self.codec_errors)[0]
 
     def init_fileoutput (self, args):
         """
@@ -250,7 +280,7 @@ class _Logger (object):
             return i18n.get_encoded_writer(encoding=self.output_encoding,
                                            errors=self.codec_errors)
         return codecs.open(self.filename, "wb", self.output_encoding,
-                           self.codec_errors)
+                           self.codec_errors, OutputBufferSize)
 
     def close_fileoutput (self):
         """
@@ -290,13 +320,32 @@ class _Logger (object):
         """
         Return wrapped version of given lines.
         """
-        sep = os.linesep+os.linesep
-        text = sep.join(lines)
-        kwargs = dict(subsequent_indent=" "*self.max_indent,
-                      initial_indent=" "*self.max_indent,
-                      break_long_words=False,
-                      break_on_hyphens=False)
-        return strformat.wrap(text, width, **kwargs).lstrip()
+        if width <= 0:
+            sep = os.linesep+os.linesep
+            return sep.join(lines).lstrip()
+        wrapper = self.get_wrapper(width)
+        wrapped = []
+        for line in lines:
+            for para in strformat.get_paragraphs(line):
+                wrapped.extend(wrapper.wrap(u" ".join(para.split())))
+        return os.linesep.join(wrapped).lstrip()
+
+    def get_wrapper (self, width):
+        """
+        Return text wrapper for given width, indenting with max_indent.
+        The wrapper is cached until width or indent change.
+        """
+        indent = u" " * self.max_indent
+        wrapper = self._wrapper
+        if (wrapper is None or wrapper.width != width or
+            wrapper.initial_indent != indent):
+            wrapper = textwrap.TextWrapper(width=width,
+                                           initial_indent=indent,
+                                           subsequent_indent=indent,
+                                           break_long_words=False,
+                                           break_on_hyphens=False)
+            self._wrapper = wrapper
+        return wrapper
 
     def write (self, s, **args):
         """Write string to output descriptor. Strips control characters
@@ -323,22 +372,22 @@ class _Logger (object):
         """
         Write string to output descriptor plus a newline.
         """
-        self.write(u"%s%s" % (s, unicode(os.linesep)), **args)
+        self.write(s + Linesep, **args)
 
     def has_part (self, name):
         """
         See if given part name will be logged.
+        Replaced by a set membership test in __init__ when only given
+        parts are logged.
         """
-        if self.logparts is None:
-            # log all parts
-            return True
-        return name in self.logparts
+        # a None value logs all parts
+        return self.logparts is None or name in self.logparts
 
     def part (self, name):
         """
         Return translated part name.
         """
-        return _(Fields.get(name, u""))
+        return self.field_labels.get(name, u"")
 
     def spaces (self, name):
         """
@@ -355,12 +404,12 @@ class _Logger (object):
             parts = Fields.keys()
         else:
             parts = self.logparts
-        values = (self.part(x) for x in parts)
+        # localized log part names, looked up once per part
+        labels = {key: self.part(key) for key in parts}
         # maximum indent for localized log part names
-        self.max_indent = max(len(x) for x in values)+1
-        for key in parts:
-            numspaces = (self.max_indent - len(self.part(key)))
-            self.logspaces[key] = u" " * numspaces
+        self.max_indent = max(map(len, labels.values()))+1
+        self.logspaces = {key: u" " * (self.max_indent - len(label))
+                          for key, label in labels.items()}
         self.stats.reset()
         self.starttime = time.time()
 
@@ -425,7 +474,12 @@ class _Logger (object):
         If the logger has internal buffers, flush them.
         Ignore flush I/O errors since we are not responsible for proper
         flushing of log output streams.
+        Files opened by the logger itself are not flushed here. Their
+        buffer is written out when it is full or when the file is closed,
+        which avoids a write call for each logged URL.
         """
+        if getattr(self, "close_fd", False):
+            return
         if hasattr(self, "fd"):
             try:
                 self.fd.flush()
@@ -449,12 +503,12 @@ class _Logger (object):
         return u""
 
 def _get_loggers():
-    """Return list of Logger classes."""
+    """Return tuple of Logger classes."""
     from .. import loader
     modules = loader.get_package_modules('logger')
-    return list(loader.get_plugins(modules, [_Logger]))
+    return tuple(loader.get_plugins(modules, [_Logger]))
 
 
 LoggerClasses = _get_loggers()
-LoggerNames = [x.LoggerName for x in LoggerClasses]
+LoggerNames = tuple(x.LoggerName for x in LoggerClasses)
 LoggerKeys = ", ".join(repr(x) for x in LoggerNames)
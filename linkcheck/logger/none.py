@@ -39,6 +39,13 @@ class NoneLogger (_Logger):
         """
         pass
 
+    def log_filter_url (self, url_data, do_print):
+        """
+        Only update accounting data, which is still needed for the
+        exit status.
+        """
+        self.stats.log_url(url_data, do_print)
+
     def log_url (self, url_data):
         """Do nothing."""
         pass
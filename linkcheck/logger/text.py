@@ -19,7 +19,7 @@ The default text logger.
 """
 import time
 from . import _Logger
-from .. import ansicolor, strformat, configuration, i18n
+from .. import ansicolor, strformat, configuration
 
 
 class TextLogger (_Logger):
@@ -56,7 +56,6 @@ class TextLogger (_Logger):
         """Initialize error counter and optional file output."""
         args = self.get_args(kwargs)
         super(TextLogger, self).__init__(**args)
-        self.output_encoding = args.get("encoding", i18n.default_encoding)
         self.init_fileoutput(args)
         self.colorparent = args.get('colorparent', 'default')
         self.colorurl = args.get('colorurl', 'default')
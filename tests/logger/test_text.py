@@ -0,0 +1,61 @@
+# -*- coding: iso-8859-1 -*-
+# Copyright (C) 2014 Bastian Kleineidam
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+import unittest
+from StringIO import StringIO
+from linkcheck import strformat
+from linkcheck.logger.text import TextLogger
+
+
+class TestTextLogger (unittest.TestCase):
+
+    def get_logger (self, **kwargs):
+        kwargs.setdefault("fd", StringIO())
+        return TextLogger(**kwargs)
+
+    def test_parts (self):
+        logger = self.get_logger(parts=["realurl", "result"])
+        self.assertTrue(logger.has_part("realurl"))
+        self.assertFalse(logger.has_part("url"))
+        logger = self.get_logger(parts=["all"])
+        self.assertTrue(logger.has_part("url"))
+        logger = self.get_logger()
+        self.assertTrue(logger.has_part("url"))
+
+    def test_part (self):
+        logger = self.get_logger()
+        self.assertEqual(logger.part("realurl"), _("Real URL"))
+        self.assertEqual(logger.part("unknown"), u"")
+
+    def test_spaces (self):
+        logger = self.get_logger(parts=["url", "realurl"])
+        logger.start_output()
+        self.assertEqual(logger.max_indent, len(logger.part("realurl")) + 1)
+        self.assertEqual(logger.spaces("realurl"), u" ")
+        self.assertEqual(len(logger.part("url") + logger.spaces("url")),
+                         logger.max_indent)
+
+    def test_wrap (self):
+        logger = self.get_logger(parts=["url", "realurl"])
+        logger.start_output()
+        lines = [u"word " * 30, u"", u"first\n\n  second  line"]
+        indent = u" " * logger.max_indent
+        expected = strformat.wrap(u"\n\n".join(lines), 40,
+            initial_indent=indent, subsequent_indent=indent,
+            break_long_words=False, break_on_hyphens=False).lstrip()
+        self.assertEqual(logger.wrap(lines, 40), expected)
+        self.assertEqual(logger.wrap([], 40), u"")